@@ -11,6 +11,12 @@ import time
 import tomllib
 import platform
 import socket
+import tempfile
+import stat
+import signal
+import hashlib
+import functools
+import threading
 import psutil
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
@@ -18,13 +24,14 @@ from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from rich.layout import Layout
 from rich.panel import Panel
-from rich.text import Text
+from rich.text import Span, Text
 from rich.columns import Columns
 from rich.align import Align
 from rich.table import Table
-from rich_gradient import Gradient
 from rich.style import Style
 from rich.box import ROUNDED, Box
+from rich.cells import get_character_cell_size
+from rich.color import Color
 import pyfiglet
 
 # Load configuration
@@ -88,15 +95,192 @@ NO_BORDER = Box(
 )
 
 # Cache settings
-CACHE_DIR = Path.home() / '.cache' / 'welcome-banner'
-WEATHER_CACHE_FILE = CACHE_DIR / 'weather.json'
-QUOTE_CACHE_FILE = CACHE_DIR / 'quote.json'
+# Shared data (weather, quotes) is host-independent and lives in the XDG cache
+# dir, which may sit on an NFS home shared by a whole cluster. Host-local data
+# (zsh version, rendered frames) goes to the per-user runtime dir or tmpfs.
+def get_shared_cache_dir():
+    """Get the cache directory for data that can be shared between hosts"""
+    if CONFIG.get('cache_dir'):
+        return Path(CONFIG['cache_dir']).expanduser()
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'welcome-banner'
+
+def get_host_cache_dir():
+    """Get the cache directory for host-local data, preferring tmpfs"""
+    if CONFIG.get('runtime_dir'):
+        return Path(CONFIG['runtime_dir']).expanduser()
+    # su/sudo can leave another user's runtime dir in the environment, and
+    # the XDG spec requires it to be owned by the user anyway
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    try:
+        if runtime_dir and os.stat(runtime_dir).st_uid == os.getuid():
+            return Path(runtime_dir) / 'welcome-banner'
+    except OSError:
+        pass
+    # Shared tmpfs/tmp needs a per-user directory
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        tmp_dir = '/dev/shm'
+    else:
+        tmp_dir = tempfile.gettempdir()
+    return Path(tmp_dir) / f'welcome-banner-{os.getuid()}'
+
+SHARED_CACHE_DIR = get_shared_cache_dir()
+HOST_CACHE_DIR = get_host_cache_dir()
+WEATHER_CACHE_FILE = SHARED_CACHE_DIR / 'weather.json'
+QUOTE_CACHE_FILE = SHARED_CACHE_DIR / 'quote.json'
+ZSH_VERSION_CACHE_FILE = HOST_CACHE_DIR / 'zsh-version.json'
+FRAME_CACHE_DIR = HOST_CACHE_DIR / 'frames'
 CACHE_DURATION = 1800  # 30 minutes
 QUOTE_CACHE_DURATION = 86400  # 24 hours
+ZSH_VERSION_CACHE_DURATION = 86400  # 24 hours (tmpfs is also cleared on reboot)
+
+# Circuit breaker settings - failed endpoints are skipped until their backoff expires
+BREAKER_CACHE_FILE = HOST_CACHE_DIR / 'breaker.json'
+BREAKER_BASE_BACKOFF = 60  # 1 minute after the first failure
+BREAKER_MAX_BACKOFF = 3600  # Doubles on each failure up to 1 hour
+BREAKER_LOCK = threading.Lock()
+
+WEATHER_URL = 'https://wttr.in?format=%c+%t+%p+%h'
+
+# Background git status settings - see get_git_status_cached()
+GIT_CACHE_DIR = HOST_CACHE_DIR / 'git'
+GIT_STATUS_CACHE_DURATION = 60  # Recount changed files at most once a minute
+GIT_STATUS_LIMIT = CONFIG.get('git_status_limit', 1000)  # Stop counting after this many
+GIT_REFRESH_TIMEOUT = 300  # Kill a background count after 5 minutes
+GIT_LOCK_STALE_AFTER = GIT_REFRESH_TIMEOUT + 60  # Allow for interpreter startup before the kill timer
+GIT_TIMEOUT_BACKOFF = 3600  # Wait an hour before recounting a repo that timed out
 
 def ensure_cache_dir():
-    """Create cache directory if it doesn't exist"""
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    """Create cache directories, returning whether the host-local cache is usable"""
+    try:
+        SHARED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        pass
+    return setup_host_cache_dir()
+
+@functools.lru_cache(maxsize=1)
+def setup_host_cache_dir():
+    """Create the host-local cache directories once, returning whether they are usable"""
+    try:
+        HOST_CACHE_DIR.mkdir(parents=True, exist_ok=True, mode=0o700)
+        # The /dev/shm fallback has a predictable name, so another user could
+        # create it first - only trust a private directory we own
+        st = os.lstat(HOST_CACHE_DIR)
+        if (not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid()
+                or st.st_mode & 0o077):
+            return False
+        FRAME_CACHE_DIR.mkdir(exist_ok=True, mode=0o700)
+        GIT_CACHE_DIR.mkdir(exist_ok=True, mode=0o700)
+    except OSError:
+        return False
+    return os.access(HOST_CACHE_DIR, os.W_OK)
+
+def read_cache(path, max_age):
+    """Read a JSON cache file, returning None if missing, broken or expired"""
+    try:
+        with open(path, 'r') as f:
+            cache_data = json.load(f)
+        if time.time() - cache_data['timestamp'] < max_age:
+            return cache_data
+    except Exception:
+        pass
+    return None
+
+def write_atomic(path, content):
+    """Atomically replace a file's content"""
+    tmp_path = None
+    try:
+        # mkstemp uses O_EXCL with a random name, so it can't follow a planted
+        # symlink; rename() is atomic on NFS too
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+def write_cache(path, data):
+    """Atomically write a JSON cache file"""
+    write_atomic(path, json.dumps({'timestamp': time.time(), **data}))
+
+def render_ascii_art(text, font, width):
+    """Render ASCII art with pyfiglet, cached per host in the frame cache"""
+    if not ensure_cache_dir():
+        return pyfiglet.figlet_format(text, font=font, width=width)
+    
+    frame_file = FRAME_CACHE_DIR / f"{font}-{width}-{text.replace(' ', '_').strip('!')}.txt"
+    try:
+        return frame_file.read_text()
+    except OSError:
+        pass
+    
+    ascii_art = pyfiglet.figlet_format(text, font=font, width=width)
+    
+    write_atomic(frame_file, ascii_art)
+    
+    return ascii_art
+
+# Gradient settings - colours are blended in linear light, like rich_gradient
+GRADIENT_GAMMA = 2.2
+SRGB_TO_LINEAR = [(channel / 255.0) ** GRADIENT_GAMMA for channel in range(256)]
+
+@functools.lru_cache(maxsize=32)
+def gradient_ramp(colors, width):
+    """Compute a hex colour for every column of a gradient, matching rich_gradient"""
+    stops = [Color.parse(color).get_truecolor() for color in colors]
+    if width <= 0:
+        return ()
+    if len(stops) == 1:
+        return (colors[0],) * width
+    
+    # rich_gradient mirrors 3+ stops (a, b, c, b, a) and shows the first half
+    if len(stops) > 2:
+        stops = stops + stops[-2::-1]
+        total_width = width * 2.0
+    else:
+        total_width = float(width)
+    segment_count = len(stops) - 1
+    
+    linear = [[SRGB_TO_LINEAR[channel] for channel in stop] for stop in stops]
+    ramp = []
+    for column in range(width):
+        position = (column + 0.5) / total_width * segment_count
+        index = int(position)
+        ratio = position - index
+        start = linear[index]
+        end = linear[min(index + 1, segment_count)]
+        red, green, blue = (
+            int(((start[i] + (end[i] - start[i]) * ratio) ** (1.0 / GRADIENT_GAMMA)) * 255.0)
+            for i in range(3)
+        )
+        ramp.append(f"#{red:02x}{green:02x}{blue:02x}")
+    return tuple(ramp)
+
+def gradient_text(text, colors):
+    """Apply a horizontal gradient to multi-line text, one colour per column"""
+    lines = text.split('\n')
+    widths = [[get_character_cell_size(character) for character in line] for line in lines]
+    width = max(sum(line_widths) for line_widths in widths)
+    ramp = [Style(color=color) for color in gradient_ramp(tuple(colors), width)]
+    
+    spans = []
+    offset = 0
+    for line, line_widths in zip(lines, widths):
+        column = 0
+        for index, (character, cell_width) in enumerate(zip(line, line_widths), offset):
+            # Spaces have no visible colour, so skip them to keep spans down
+            if not character.isspace():
+                spans.append(Span(index, index + 1, ramp[min(column + cell_width // 2, width - 1)]))
+            column += cell_width
+        offset += len(line) + 1
+    
+    return Text(text, spans=spans)
 
 def get_greeting(terminal_width=None):
     """Get time-based greeting with ASCII art and gradient colors"""
@@ -136,16 +320,16 @@ def get_greeting(terminal_width=None):
     
     # Create ASCII art using pyfiglet with terminal width
     try:
-        ascii_art = pyfiglet.figlet_format(display_greeting, font=selected_font, width=terminal_width)
+        ascii_art = render_ascii_art(display_greeting, selected_font, terminal_width)
     except Exception:
         # Fallback to a simple font if the selected one fails
-        ascii_art = pyfiglet.figlet_format(display_greeting, font='standard', width=terminal_width)
+        ascii_art = render_ascii_art(display_greeting, 'standard', terminal_width)
     
     # Apply gradient to ASCII art
-    gradient_text = Gradient(ascii_art.rstrip(), colors=colors)
+    banner = gradient_text(ascii_art.rstrip(), colors)
     
     # Return gradient text without centering - we'll center it when printing
-    return gradient_text
+    return banner
 
 def run_command(cmd, timeout=1.0):
     """Run shell command with timeout"""
@@ -163,6 +347,86 @@ def run_command(cmd, timeout=1.0):
     except Exception:
         return None
 
+def is_online():
+    """Quick connectivity check that sends no packets
+
+    Connecting a UDP socket only asks the kernel for a route, so this fails
+    instantly when there is no network instead of waiting on a timeout.
+    Either an IPv4 or an IPv6 route counts, for IPv6-only networks.
+    """
+    for family, address in ((socket.AF_INET, ('1.1.1.1', 53)),
+                            (socket.AF_INET6, ('2606:4700:4700::1111', 53))):
+        try:
+            with socket.socket(family, socket.SOCK_DGRAM) as sock:
+                sock.connect(address)
+            return True
+        except OSError:
+            pass
+    return False
+
+def endpoint_available(endpoint):
+    """Check whether an endpoint's circuit breaker allows a request"""
+    if not ensure_cache_dir():
+        return True
+    
+    breaker = read_cache(BREAKER_CACHE_FILE, BREAKER_MAX_BACKOFF * 2) or {}
+    state = breaker.get('endpoints', {}).get(endpoint)
+    return not state or time.time() >= state['retry_at']
+
+def record_endpoint_result(endpoint, success):
+    """Record an endpoint success or failure with exponential backoff"""
+    if not ensure_cache_dir():
+        return
+    
+    with BREAKER_LOCK:
+        breaker = read_cache(BREAKER_CACHE_FILE, BREAKER_MAX_BACKOFF * 2) or {}
+        endpoints = breaker.get('endpoints', {})
+        
+        if success:
+            if endpoint not in endpoints:
+                return
+            del endpoints[endpoint]
+        else:
+            failures = endpoints.get(endpoint, {}).get('failures', 0) + 1
+            backoff = min(BREAKER_BASE_BACKOFF * 2 ** (failures - 1), BREAKER_MAX_BACKOFF)
+            endpoints[endpoint] = {
+                'failures': failures,
+                'retry_at': time.time() + backoff
+            }
+        
+        write_cache(BREAKER_CACHE_FILE, {'endpoints': endpoints})
+
+def fetch_url(url, timeout):
+    """Fetch a URL with curl, honouring the circuit breaker
+
+    Returns None without touching the network when offline or when the
+    endpoint is still backing off from earlier failures. HTML responses
+    (captive portals, error pages) count as failures.
+    """
+    if not endpoint_available(url) or not is_online():
+        return None
+    
+    response = run_command(f"curl -s -m {timeout} '{url}'", timeout=timeout)
+    success = bool(response and response.strip() and not response.lstrip().startswith('<'))
+    record_endpoint_result(url, success)
+    
+    return response if success else None
+
+def get_zsh_version():
+    """Get the zsh version, cached per host"""
+    host_cache = ensure_cache_dir()
+    
+    cache_data = read_cache(ZSH_VERSION_CACHE_FILE, ZSH_VERSION_CACHE_DURATION) if host_cache else None
+    if cache_data:
+        return cache_data['zsh_version']
+    
+    # Keep zsh version check as subprocess since it's shell-specific
+    zsh_version = run_command("zsh --version | awk '{print $2}'")
+    # Don't cache a failed lookup (e.g. a timeout on a loaded host)
+    if host_cache and zsh_version:
+        write_cache(ZSH_VERSION_CACHE_FILE, {'zsh_version': zsh_version})
+    return zsh_version
+
 def get_system_info():
     """Get system information"""
     info = []
@@ -180,8 +444,7 @@ def get_system_info():
     
     # Shell
     shell = os.environ.get('SHELL', 'unknown').split('/')[-1]
-    # Keep zsh version check as subprocess since it's shell-specific
-    zsh_version = run_command("zsh --version | awk '{print $2}'")
+    zsh_version = get_zsh_version()
     if zsh_version:
         info.append(f"[{THEME['dim']}]Shell:[/] {shell} {zsh_version}")
     else:
@@ -232,17 +495,152 @@ def get_system_info():
     
     return "\n".join(info)
 
+def get_git_status_cache_file(toplevel):
+    """Get the host-local cache file for a repository's changed-file count"""
+    repo_hash = hashlib.sha1(toplevel.encode()).hexdigest()[:16]
+    return GIT_CACHE_DIR / f'{repo_hash}.json'
+
+def get_git_status_cached(toplevel, git_dir):
+    """Get a cached (count, truncated) for a repository, refreshing it in the background"""
+    if not ensure_cache_dir():
+        return None
+    cache_file = get_git_status_cache_file(toplevel)
+    
+    cache_data = read_cache(cache_file, float('inf'))
+    try:
+        index_mtime = (Path(git_dir) / 'index').stat().st_mtime
+    except OSError:
+        index_mtime = 0
+    
+    if not cache_data:
+        start_git_status_refresh(toplevel, cache_file)
+    elif cache_data.get('timed_out'):
+        if time.time() - cache_data['timestamp'] >= GIT_TIMEOUT_BACKOFF:
+            start_git_status_refresh(toplevel, cache_file)
+    elif (time.time() - cache_data['timestamp'] >= GIT_STATUS_CACHE_DURATION
+            or index_mtime > cache_data['timestamp']):
+        start_git_status_refresh(toplevel, cache_file)
+    
+    if cache_data:
+        return (cache_data['count'], cache_data['truncated'])
+    return None
+
+def start_git_status_refresh(toplevel, cache_file):
+    """Start a detached background process to recount changed files"""
+    lock_file = cache_file.with_suffix('.lock')
+    
+    # Only one refresh per repository at a time, unless the last one died
+    try:
+        if time.time() - lock_file.stat().st_mtime < GIT_LOCK_STALE_AFTER:
+            return
+        lock_file.unlink()
+    except OSError:
+        pass
+    
+    # The token lets the refresh remove only its own lock
+    token = os.urandom(8).hex()
+    try:
+        fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except OSError:
+        return
+    with os.fdopen(fd, 'w') as f:
+        f.write(token)
+    
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), '--git-refresh', toplevel, token],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    except Exception:
+        release_git_status_lock(lock_file, token)
+
+def release_git_status_lock(lock_file, token):
+    """Remove a refresh lock, but only if it still holds our token"""
+    try:
+        if lock_file.read_text() == token:
+            lock_file.unlink()
+    except OSError:
+        pass
+
+def refresh_git_status(toplevel, token):
+    """Count changed files in a repository and cache the result"""
+    if not ensure_cache_dir():
+        return
+    cache_file = get_git_status_cache_file(toplevel)
+    lock_file = cache_file.with_suffix('.lock')
+    
+    proc = None
+    timer = None
+    try:
+        proc = subprocess.Popen(
+            ['git', '--no-optional-locks', '-C', toplevel, 'status', '--porcelain'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        timed_out = threading.Event()
+        
+        def kill_git():
+            # Kill the whole process group, hooks and helpers included
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except OSError:
+                pass
+        
+        def on_timeout():
+            timed_out.set()
+            kill_git()
+        
+        timer = threading.Timer(GIT_REFRESH_TIMEOUT, on_timeout)
+        timer.start()
+        
+        count = 0
+        truncated = False
+        for _ in proc.stdout:
+            count += 1
+            if count > GIT_STATUS_LIMIT:
+                count = GIT_STATUS_LIMIT
+                truncated = True
+                kill_git()
+                break
+        
+        proc.wait()
+        
+        if timed_out.is_set():
+            write_cache(cache_file, {'count': count, 'truncated': True, 'timed_out': True})
+        elif truncated or proc.returncode == 0:
+            write_cache(cache_file, {'count': count, 'truncated': truncated})
+    finally:
+        if timer:
+            timer.cancel()
+        if proc and proc.poll() is None:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except OSError:
+                pass
+        release_git_status_lock(lock_file, token)
+
 def get_git_info():
     """Get git repository information"""
+    background_status = CONFIG.get('git_background_status', False)
+    
     # Single git command to get all info at once
-    git_cmd = """git rev-parse --git-dir >/dev/null 2>&1 && echo "GITOK" && git branch --show-current && git status --porcelain | wc -l"""
+    if background_status:
+        # Counting changes is left to a background process, see get_git_status_cached().
+        # --show-toplevel fails inside .git or a bare repo; still show the branch there
+        git_cmd = """git rev-parse --git-dir >/dev/null 2>&1 && echo "GITOK" && git branch --show-current && git rev-parse --show-toplevel --absolute-git-dir 2>/dev/null; true"""
+    else:
+        git_cmd = """git rev-parse --git-dir >/dev/null 2>&1 && echo "GITOK" && git branch --show-current && git status --porcelain | wc -l"""
     git_output = run_command(git_cmd)
     
     if not git_output or "GITOK" not in git_output:
         return None
     
     lines = git_output.strip().split('\n')
-    if len(lines) < 3:
+    if len(lines) < (2 if background_status else 3):
         return None
     
     info = []
@@ -252,15 +650,34 @@ def get_git_info():
     if branch:
         info.append(f"[{THEME['dim']}]Branch:[/] [{THEME['green']}]{branch}[/]")
     
-    # Status count (third line)
-    try:
-        status_count = int(lines[2].strip())
-        if status_count > 0:
-            info.append(f"[{THEME['dim']}]Changes:[/] [{THEME['yellow']}]{status_count} files[/]")
-        else:
-            info.append(f"[{THEME['dim']}]Status:[/] [{THEME['green']}]Clean ✓[/]")
-    except ValueError:
-        # If we can't parse the count, assume clean
+    # Status count (third line, or from the background cache)
+    truncated = False
+    if background_status:
+        # No work tree, so nothing to count
+        if len(lines) < 4:
+            return "\n".join(info) if info else None
+        git_status = get_git_status_cached(lines[2].strip(), lines[3].strip())
+        if git_status is None:
+            # Without a host-local cache no count will ever arrive
+            if ensure_cache_dir():
+                info.append(f"[{THEME['dim']}]Changes:[/] [{THEME['dim']}]counting…[/]")
+            return "\n".join(info) if info else None
+        status_count, truncated = git_status
+    else:
+        try:
+            status_count = int(lines[2].strip())
+        except ValueError:
+            # If we can't parse the count, assume clean
+            status_count = 0
+    
+    if truncated and status_count == 0:
+        # Timed out before git printed anything
+        info.append(f"[{THEME['dim']}]Changes:[/] [{THEME['yellow']}]too many to count[/]")
+    elif truncated:
+        info.append(f"[{THEME['dim']}]Changes:[/] [{THEME['yellow']}]{status_count}+ files[/]")
+    elif status_count > 0:
+        info.append(f"[{THEME['dim']}]Changes:[/] [{THEME['yellow']}]{status_count} files[/]")
+    else:
         info.append(f"[{THEME['dim']}]Status:[/] [{THEME['green']}]Clean ✓[/]")
     
     return "\n".join(info) if info else None
@@ -270,28 +687,16 @@ def get_weather_cached():
     ensure_cache_dir()
     
     # Check cache
-    if WEATHER_CACHE_FILE.exists():
-        try:
-            with open(WEATHER_CACHE_FILE, 'r') as f:
-                cache_data = json.load(f)
-                if time.time() - cache_data['timestamp'] < CACHE_DURATION:
-                    return cache_data['weather']
-        except Exception:
-            pass
+    cache_data = read_cache(WEATHER_CACHE_FILE, CACHE_DURATION)
+    if cache_data:
+        return cache_data['weather']
     
     # Fetch new weather with 0.5 second timeout
-    weather = run_command("curl -s -m 0.5 'https://wttr.in?format=%c+%t+%p+%h'", timeout=0.5)
+    weather = fetch_url(WEATHER_URL, timeout=0.5)
     
     if weather:
         # Cache the result
-        try:
-            with open(WEATHER_CACHE_FILE, 'w') as f:
-                json.dump({
-                    'timestamp': time.time(),
-                    'weather': weather
-                }, f)
-        except Exception:
-            pass
+        write_cache(WEATHER_CACHE_FILE, {'weather': weather})
     
     return weather
 
@@ -351,14 +756,9 @@ def get_random_quote():
     ]
     
     # Check cache first
-    if QUOTE_CACHE_FILE.exists():
-        try:
-            with open(QUOTE_CACHE_FILE, 'r') as f:
-                cache_data = json.load(f)
-                if time.time() - cache_data['timestamp'] < QUOTE_CACHE_DURATION:
-                    return (cache_data['quote'], cache_data['author'])
-        except Exception:
-            pass
+    cache_data = read_cache(QUOTE_CACHE_FILE, QUOTE_CACHE_DURATION)
+    if cache_data:
+        return (cache_data['quote'], cache_data['author'])
     
     # Try to fetch from API with very short timeout
     # Multiple API endpoints to try in order
@@ -370,8 +770,8 @@ def get_random_quote():
     
     api_quote = None
     for endpoint in api_endpoints:
-        api_quote = run_command(f"curl -s -m 1 '{endpoint}'", timeout=1.0)
-        if api_quote and api_quote.strip() and not api_quote.startswith('<!'):
+        api_quote = fetch_url(endpoint, timeout=1.0)
+        if api_quote:
             break
     
     if api_quote:
@@ -395,15 +795,10 @@ def get_random_quote():
             
             if quote_text:  # Valid quote received
                 # Cache the result
-                try:
-                    with open(QUOTE_CACHE_FILE, 'w') as f:
-                        json.dump({
-                            'timestamp': time.time(),
-                            'quote': quote_text,
-                            'author': author
-                        }, f)
-                except Exception:
-                    pass
+                write_cache(QUOTE_CACHE_FILE, {
+                    'quote': quote_text,
+                    'author': author
+                })
                 
                 return (quote_text, author)
         except json.JSONDecodeError:
@@ -629,4 +1024,7 @@ def main():
         console.print(centered_quote)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) == 4 and sys.argv[1] == '--git-refresh':
+        refresh_git_status(sys.argv[2], sys.argv[3])
+    else:
+        main()
\ No newline at end of file
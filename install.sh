@@ -70,7 +70,6 @@ MISSING_DEPS=()
 
 # Check each dependency
 python3 -c "import rich" 2>/dev/null || MISSING_DEPS+=("rich")
-python3 -c "import rich_gradient" 2>/dev/null || MISSING_DEPS+=("rich-gradient")
 python3 -c "import pyfiglet" 2>/dev/null || MISSING_DEPS+=("pyfiglet")
 python3 -c "import requests" 2>/dev/null || MISSING_DEPS+=("requests")
 python3 -c "import psutil" 2>/dev/null || MISSING_DEPS+=("psutil")
@@ -80,7 +79,7 @@ if [ ${#MISSING_DEPS[@]} -eq 0 ]; then
 else
     echo -e "${YELLOW}Missing dependencies: ${MISSING_DEPS[*]}${NC}"
     echo -e "\nTo install all dependencies at once:"
-    echo -e "${GREEN}pip3 install --user rich rich-gradient pyfiglet requests psutil${NC}"
+    echo -e "${GREEN}pip3 install --user rich pyfiglet requests psutil${NC}"
     echo -e "\nOr install using requirements.txt:"
     echo -e "${GREEN}pip3 install --user -r $SCRIPT_DIR/requirements.txt${NC}"
 fi
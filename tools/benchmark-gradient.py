@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark the built-in gradient engine in hello-zsh.py against rich_gradient
+Checks both produce the same colour in every cell and compares render times,
+including the one-off import cost every new shell pays
+"""
+
+import importlib.util
+import io
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pyfiglet
+from rich.align import Align
+from rich.console import Console
+
+try:
+    from rich_gradient import Gradient
+except ImportError:
+    print("rich_gradient is needed for the comparison: pip3 install --user rich-gradient")
+    sys.exit(1)
+
+# hello-zsh.py isn't importable by name, so load it from its path
+spec = importlib.util.spec_from_file_location("hello_zsh", Path(__file__).parent.parent / "hello-zsh.py")
+hello_zsh = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(hello_zsh)
+
+WIDTHS = [60, 80, 120, 160, 200, 240]
+REPEATS = 20
+
+# The three-stop gradients get_greeting() uses with the active theme
+THEME = hello_zsh.THEME
+GRADIENTS = {
+    'night': [THEME['purple'], THEME['blue'], THEME['dim']],
+    'morning': [THEME['blue'], THEME.get('light_cyan', THEME['cyan']), THEME['white']],
+    'afternoon': [THEME['yellow'], THEME['orange'], THEME['white']],
+}
+COLORS = GRADIENTS['afternoon']
+
+def render_lines(renderable, width):
+    """Render the banner the way main() prints it, as lines of segments"""
+    console = Console(file=io.StringIO(), width=width, color_system="truecolor", force_terminal=True)
+    return console.render_lines(Align(renderable, align="center"), pad=False)
+
+def cell_colors(lines):
+    """Map each visible (non-space) cell to its foreground colour"""
+    colors = {}
+    for row, segments in enumerate(lines):
+        column = 0
+        for segment in segments:
+            for character in segment.text:
+                if not character.isspace():
+                    color = segment.style.color if segment.style else None
+                    colors[(row, column)] = color.get_truecolor() if color else None
+                column += 1
+    return colors
+
+def time_render(make_renderable, width):
+    """Average time to build and print a renderable, in milliseconds"""
+    console = Console(file=io.StringIO(), width=width, color_system="truecolor", force_terminal=True)
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        hello_zsh.gradient_ramp.cache_clear()
+        console.print(Align(make_renderable(), align="center"))
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+def time_ramp(width):
+    """Average time to compute one uncached colour ramp, in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        hello_zsh.gradient_ramp.cache_clear()
+        hello_zsh.gradient_ramp(tuple(COLORS), width)
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+def time_import(module):
+    """Time importing a module in a fresh interpreter with rich already loaded, in milliseconds
+
+    Returns None if the module isn't installed. The built-in engine only
+    needs rich, which the banner imports anyway, so this is the extra
+    startup cost each shell pays for the module.
+    """
+    code = (
+        "import time, rich.console, rich.text, rich.align\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    times = []
+    for _ in range(5):
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        times.append(float(result.stdout))
+    return min(times)
+
+def compare(text="Good Afternoon!", font="colossal"):
+    """Compare output and speed of both gradient engines across widths"""
+    rich_gradient_import_ms = time_import("rich_gradient")
+    numpy_import_ms = time_import("numpy")
+    print(f"🎨 Gradient benchmark: '{text}' in {font}, {REPEATS} repeats\n")
+    print(f"import rich_gradient: {rich_gradient_import_ms:.1f}ms (built-in engine: no extra imports)")
+    if numpy_import_ms is not None:
+        print(f"import numpy:         {numpy_import_ms:.1f}ms (why the built-in engine doesn't use it)")
+    print()
+    print(f"{'width':>6} {'cells':>6} {'diff':>5} {'rich_gradient':>14} {'+ import':>10} {'built-in':>10} {'ramp':>9}")
+    print("-" * 66)
+
+    for width in WIDTHS:
+        ascii_art = pyfiglet.figlet_format(text, font=font, width=width).rstrip()
+
+        # Largest per-channel difference across all cells, or -1 if cells differ
+        max_diff = 0
+        for colors in GRADIENTS.values():
+            expected = cell_colors(render_lines(Gradient(ascii_art, colors=colors), width))
+            actual = cell_colors(render_lines(hello_zsh.gradient_text(ascii_art, colors), width))
+            if expected.keys() != actual.keys():
+                max_diff = -1
+                break
+            max_diff = max(
+                max_diff,
+                *(abs(a - b) for cell in expected for a, b in zip(expected[cell], actual[cell]))
+            )
+
+        rich_ms = time_render(lambda: Gradient(ascii_art, colors=COLORS), width)
+        builtin_ms = time_render(lambda: hello_zsh.gradient_text(ascii_art, COLORS), width)
+        ramp_ms = time_ramp(width)
+
+        print(f"{width:>6} {len(expected):>6} {max_diff:>5} {rich_ms:>12.2f}ms "
+              f"{rich_ms + rich_gradient_import_ms:>8.2f}ms {builtin_ms:>8.2f}ms {ramp_ms:>7.3f}ms")
+
+    print(f"\ndiff is the largest colour channel difference across the {', '.join(GRADIENTS)} gradients (0 = identical)")
+    print("+ import is what a new shell pays for its one banner with rich_gradient; built-in needs no imports")
+
+if __name__ == "__main__":
+    compare()